@@ -1,21 +1,57 @@
-import streamlit as st
+import time
+_T0 = time.perf_counter()
+
+import importlib
 import os
-from views import stock_analysis, market_analysis
+import sys
+import streamlit as st
 
-# CSS読み込み
-def local_css(file_name):
+# 起動時間計測 (ステップ名, 経過秒)
+_timings = [("import streamlit", time.perf_counter() - _T0)]
+
+def _mark(label, started):
+    """計測ステップを記録し、次の開始時刻を返す"""
+    now = time.perf_counter()
+    _timings.append((label, now - started))
+    return now
+
+def _report_startup(page, cold):
+    """起動時間レポートを出力 (市場分析の初回描画までの時間を追跡する)"""
+    total = sum(sec for _, sec in _timings)
+    state = "cold" if cold else "warm"
+    print(f"[Startup] page={page} ({state}) total={total * 1000:.1f}ms")
+    for label, sec in _timings:
+        print(f"[Startup]   {label:<24} {sec * 1000:8.1f}ms")
+
+# CSS読み込み (プロセス内で一度だけディスクから読む)
+@st.cache_resource(show_spinner=False)
+def load_css(file_name):
     try:
         with open(file_name) as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+            return f.read()
     except FileNotFoundError:
-        pass
+        return None
+
+def local_css(file_name):
+    css = load_css(file_name)
+    if css:
+        st.markdown(f'<style>{css}</style>', unsafe_allow_html=True)
 
+# ページ名 → ビューモジュール (選択されたページだけを遅延読み込みする)
+PAGES = {
+    "市場分析 (Light)": "views.market_analysis",
+    "銘柄分析": "views.stock_analysis",
+}
+
+t = time.perf_counter()
 st.set_page_config(page_title="market-log", layout="wide")
 local_css("style.css")
+t = _mark("page config + css", t)
 
 # サイドバー (ここを入れ替えました)
 st.sidebar.title("MENU")
-page = st.sidebar.radio("機能を選択", ["市場分析 (Light)", "銘柄分析"])
+page = st.sidebar.radio("機能を選択", list(PAGES))
+t = _mark("sidebar", t)
 
 # APIキー
 # APIキー読み込み（Renderの環境変数 または ローカルのsecrets.toml）
@@ -26,8 +62,14 @@ if not API_KEY and "JQUANTS_API_KEY" in st.secrets:
 if not API_KEY:
     st.error("APIキーが設定されていません。RenderのEnvironment Variablesを設定してください。")
     st.stop()
+t = _mark("api key", t)
+
 # ルーティング
-if page == "市場分析 (Light)":
-    market_analysis.render(API_KEY)
-elif page == "銘柄分析":
-    stock_analysis.render(API_KEY)
\ No newline at end of file
+module_name = PAGES[page]
+cold = module_name not in sys.modules
+view = importlib.import_module(module_name)
+t = _mark(f"import {module_name}", t)
+
+view.render(API_KEY)
+_mark("render", t)
+_report_startup(page, cold)
@@ -1,8 +1,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import data_manager
 from datetime import datetime, timedelta
 
@@ -26,6 +24,9 @@ def calculate_technical_indicators(df):
 
 def plot_candlestick_chart(df, name, code):
     """Plotlyを使って高機能チャートを描画する"""
+    # Plotlyは重いため、チャート描画時に初めて読み込む
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
     
     # 1. 表示期間を「半年前〜今日」にフィルタリング
     end_date = df['Date'].max()